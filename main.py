@@ -1,23 +1,31 @@
 """
 Command line entry point.
 """
+import sys
 from trading_bot.cli import build_parser
-from trading_bot.config import Config
-from trading_bot.exec.backtest_exec import BacktestExec
-from trading_bot.data.csv_feed import CsvFeed
-from trading_bot.strategy.distance_time import DistanceTime
 
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
+    # Import per command so --help and argument errors stay fast
+    from trading_bot.config import Config
+    from trading_bot.strategy.distance_time import DistanceTime
     if args.cmd == "backtest":
+        from trading_bot.data.csv_feed import CsvFeed
+        from trading_bot.exec.backtest_exec import BacktestExec
         cfg = Config.load(args.config)
         csv_path = args.csv or cfg.backtest.get("csv_path")
-        feed_iter = CsvFeed(csv_path).iter()
+        start = args.start or cfg.backtest.get("start")
+        end = args.end or cfg.backtest.get("end")
+        try:
+            feed = CsvFeed(csv_path, start=start, end=end, engine=args.engine,
+                           tz=cfg.backtest.get("tz"))
+        except ImportError as e:  # optional CSV engine not installed
+            parser.error(str(e))
         strat = DistanceTime(cfg)
         executor = BacktestExec(cfg)
-        stats = executor.run(feed_iter, strat)
-        print(stats)
+        stats = executor.run(feed, strat)
+        sys.stdout.buffer.write(stats.to_json() + b"\n")
     else:
         cfg = Config.load(args.config)
         dry = not args.send
@@ -1,7 +1,6 @@
 """
 Minimal GUI stub. Loads Config and shows main window.
 """
-from PyQt5.QtWidgets import QApplication
 from trading_bot.config import Config
 # Placeholder GUI reference to keep file compiling if GUI not present
 class MainWindow(object):
@@ -9,6 +8,7 @@ class MainWindow(object):
     def show(self): pass
 
 def main():
+    from PyQt5.QtWidgets import QApplication  # lazy import
     app = QApplication([])
     try:
         cfg = Config.load("config.yaml")
@@ -0,0 +1,16 @@
+"""
+Optional Numba support.
+
+Kernels import ``njit`` from here so the package still works (slowly) when
+numba is not installed.
+"""
+try:
+    from numba import njit  # noqa: F401
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
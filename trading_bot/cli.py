@@ -10,6 +10,8 @@ def build_parser() -> argparse.ArgumentParser:
     back.add_argument("--csv")
     back.add_argument("--start")
     back.add_argument("--end")
+    back.add_argument("--engine", choices=("pandas", "polars"), default="pandas",
+                      help="CSV reader; polars (optional, >=1.25) streams the file and filters by --start/--end while scanning")
     live = sub.add_parser("live", help="Run live trading")
     live.add_argument("--config", required=True)
     live.add_argument("--dry-run", action="store_true", default=True)
@@ -1,11 +1,54 @@
 """
 Configuration loading and validation.
 """
+import hashlib
+import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import yaml
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Bump whenever _validate changes so sidecars written by older checks are re-validated
+_CACHE_VERSION = 2
+
+def _read_cache(cache_path: Path, digest: str) -> Optional[Dict[str, Any]]:
+    # Anything other than a well-formed entry for this digest is a miss
+    try:
+        cached = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("sha1") != digest:
+        return None
+    data = cached.get("data")
+    return data if isinstance(data, dict) else None
+
+def _write_cache(cache_path: Path, digest: str, data: Dict[str, Any]) -> None:
+    # Best effort: a read-only directory or non-JSON value just means no cache
+    tmp = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp.write_text(json.dumps({"sha1": digest, "data": data}))
+        os.replace(tmp, cache_path)
+    except (OSError, TypeError, ValueError):
+        tmp.unlink(missing_ok=True)
+
+def _positive(section: Dict[str, Any], key: str, name: str) -> None:
+    value = section.get(key, 0)
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+        raise ValueError(f"{name} must be positive")
+
+def _validate(data: Any) -> None:
+    # Explicit checks rather than assert, which python -O strips
+    if not isinstance(data, dict):
+        raise ValueError("config must be a mapping")
+    _positive(data, "risk_pct", "risk_pct")
+    s = data.get("strategy", {})
+    if not isinstance(s, dict):
+        raise ValueError("strategy must be a mapping")
+    for key in ("sl_pips", "distance_pips", "tp_rr"):
+        _positive(s, key, f"strategy.{key}")
+
 @dataclass
 class Config:
     symbol: str
@@ -17,13 +60,18 @@ class Config:
     slippage_points: int
     strategy: Dict[str, Any]
     backtest: Dict[str, Any]
+    contract_size: float = 100000.0
 
     @staticmethod
     def load(path: str) -> "Config":
-        data = yaml.safe_load(Path(path).read_text())
-        assert data.get("risk_pct", 0) > 0, "risk_pct must be positive"
-        s = data.get("strategy", {})
-        assert s.get("sl_pips", 0) > 0, "strategy.sl_pips must be positive"
-        assert s.get("distance_pips", 0) > 0, "strategy.distance_pips must be positive"
-        assert s.get("tp_rr", 0) > 0, "strategy.tp_rr must be positive"
+        src = Path(path)
+        raw = src.read_bytes()
+        digest = hashlib.sha1(b"%d:" % _CACHE_VERSION + raw).hexdigest()
+        # Validated data is cached next to the YAML, keyed by its content hash
+        cache_path = src.with_suffix(".yaml.cache.json")
+        data = _read_cache(cache_path, digest)
+        if data is None:
+            data = yaml.load(raw, Loader=_YamlLoader)
+            _validate(data)
+            _write_cache(cache_path, digest, data)
         return Config(**data)
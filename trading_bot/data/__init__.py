@@ -1 +1,11 @@
-from .csv_feed import CsvFeed  # noqa: F401
\ No newline at end of file
+__all__ = ["CsvFeed", "CandleArray"]
+
+def __getattr__(name):
+    # pandas is only imported when the feed is used
+    if name == "CsvFeed":
+        from .csv_feed import CsvFeed
+        return CsvFeed
+    if name == "CandleArray":
+        from .candle_array import CandleArray
+        return CandleArray
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
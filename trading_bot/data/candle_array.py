@@ -0,0 +1,49 @@
+"""
+Columnar candle store.
+"""
+import numpy as np
+
+def _to_ns(t) -> int:
+    # pandas Timestamps carry epoch nanoseconds; plain datetimes go through numpy
+    ns = getattr(t, "value", None)
+    return ns if ns is not None else int(np.datetime64(t, "ns").astype(np.int64))
+
+class CandleArray:
+    """Append-only column store of candles, grown by doubling.
+
+    ``arrays()`` returns the same (time, open, high, low, close, volume) layout as
+    ``CsvFeed.arrays()``, so it can stand in for a feed in the backtester.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        capacity = max(1, capacity)
+        self._n = 0
+        self._time = np.empty(capacity, np.int64)  # epoch ns
+        self._open, self._high, self._low, self._close, self._volume = (
+            np.empty(capacity) for _ in range(5))
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _grow(self) -> None:
+        size = 2 * len(self._time)
+        for k in ("_time", "_open", "_high", "_low", "_close", "_volume"):
+            setattr(self, k, np.resize(getattr(self, k), size))
+
+    def append(self, bar) -> None:
+        i = self._n
+        if i == len(self._time):
+            self._grow()
+        self._time[i] = _to_ns(bar.time)
+        self._open[i] = bar.open
+        self._high[i] = bar.high
+        self._low[i] = bar.low
+        self._close[i] = bar.close
+        self._volume[i] = bar.volume
+        self._n = i + 1
+
+    def arrays(self):
+        """Return (time, open, high, low, close, volume) views of the filled rows."""
+        n = self._n
+        return (self._time[:n].view("datetime64[ns]"), self._open[:n], self._high[:n],
+                self._low[:n], self._close[:n], self._volume[:n])
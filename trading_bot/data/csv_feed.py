@@ -1,25 +1,102 @@
 """
 CSV data feed for the trading bot.
 """
+import numpy as np
 import pandas as pd
 from trading_bot.types import Candle
 
+_DTYPES = {k: "float64" for k in ("open","high","low","close","volume","bid","ask")}
+
+def _read_csv(path: str) -> pd.DataFrame:
+    # The Arrow reader is multi-threaded; fall back to the C engine without pyarrow.
+    # round_trip makes the C parser exact, so prices match pyarrow's to the last bit
+    try:
+        return pd.read_csv(path, engine="pyarrow", dtype=_DTYPES, parse_dates=["time"])
+    except ImportError:
+        return pd.read_csv(path, dtype=_DTYPES, parse_dates=["time"], float_precision="round_trip")
+
+def _bound(value, col_tz, tz) -> pd.Timestamp:
+    """``value`` as a Timestamp comparable with a time column in zone ``col_tz`` (None: naive).
+
+    Naive bounds are read in ``tz``, defaulting to the column's own zone; aware bounds
+    against a naive column are taken as UTC.
+    """
+    ts = pd.Timestamp(value)
+    if col_tz is None:
+        return ts.tz_convert("UTC").tz_localize(None) if ts.tz is not None else ts
+    if ts.tz is None:
+        ts = ts.tz_localize(tz or col_tz)
+    return ts.tz_convert(col_tz)
+
+def _load_pandas(path: str, start, end, tz) -> dict:
+    df = _read_csv(path)
+    # Normalize columns to lower-case
+    df.columns = df.columns.str.lower()
+    col_tz = df["time"].dt.tz
+    if start is not None:
+        df = df[df["time"] >= _bound(start, col_tz, tz)]
+    if end is not None:
+        df = df[df["time"] <= _bound(end, col_tz, tz)]
+    if col_tz is not None:
+        df["time"] = df["time"].dt.tz_convert(None)  # UTC, naive
+    df = df.sort_values("time")
+    return {k: df[k].to_numpy() for k in df.columns}
+
+def _load_polars(path: str, start, end, tz) -> dict:
+    try:
+        import polars as pl  # optional dependency, see requirements.txt
+    except ImportError:
+        raise ImportError("engine='polars' requires polars>=1.25: pip install 'polars>=1.25'") from None
+    lf = pl.scan_csv(path, try_parse_dates=True)
+    lf = lf.rename({c: c.lower() for c in lf.collect_schema().names()})
+    col_tz = getattr(lf.collect_schema()["time"], "time_zone", None)
+    # Filters are pushed down into the scan, so rows outside the range are never materialized
+    if start is not None:
+        lf = lf.filter(pl.col("time") >= _bound(start, col_tz, tz).to_pydatetime())
+    if end is not None:
+        lf = lf.filter(pl.col("time") <= _bound(end, col_tz, tz).to_pydatetime())
+    if col_tz is not None:
+        lf = lf.with_columns(pl.col("time").dt.convert_time_zone("UTC").dt.replace_time_zone(None))
+    df = lf.sort("time").collect(engine="streaming")
+    return {k: df[k].to_numpy() for k in df.columns}
+
 class CsvFeed:
-    def __init__(self, path: str):
-        self.df = pd.read_csv(path, parse_dates=["time"]).sort_values("time").reset_index(drop=True)
-        # Normalize columns to lower-case
-        self.df.columns = self.df.columns.str.lower()
+    def __init__(self, path: str, start=None, end=None, engine: str = "pandas", tz=None):
+        """Load ``path``, keeping rows with ``start <= time <= end`` when bounds are given.
+
+        Naive ``start``/``end`` are read in ``tz`` when the time column carries a
+        timezone (default: the column's own zone). Timezone-aware times are converted
+        to UTC, so ``self.time`` (and ``Candle.time``) is always tz-naive; naive CSV
+        times are kept as written.
+        ``engine="polars"`` streams the file through a Polars LazyFrame (requires polars>=1.25).
+        """
+        if engine == "polars":
+            cols = _load_polars(path, start, end, tz)
+        elif engine == "pandas":
+            cols = _load_pandas(path, start, end, tz)
+        else:
+            raise ValueError(f"unknown CSV engine: {engine}")
+        # Keep column-major float64 arrays only
+        self.time = cols["time"].astype("datetime64[ns]", copy=False)
+        if {"open","high","low","close"}.issubset(cols):
+            self.open, self.high, self.low, self.close = (
+                np.ascontiguousarray(cols[k], np.float64) for k in ("open","high","low","close"))
+        else:
+            # Fallback if only bid/ask present
+            self.close = np.ascontiguousarray(cols["bid" if "bid" in cols else "ask"], np.float64)
+            self.open = self.high = self.low = self.close
+        self.volume = (np.ascontiguousarray(cols["volume"], np.float64) if "volume" in cols
+                       else np.zeros(len(self.time)))
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def arrays(self):
+        """Return contiguous (time, open, high, low, close, volume) ndarrays."""
+        return self.time, self.open, self.high, self.low, self.close, self.volume
 
     def iter(self):
-        cols = set(self.df.columns)
-        use_ohlc = {"open","high","low","close"}.issubset(cols)
-        for r in self.df.itertuples(index=False):
-            if use_ohlc:
-                yield Candle(r.time, r.open, r.high, r.low, r.close, getattr(r, "volume", 0.0))
-            else:
-                # Fallback if only bid/ask present
-                close = getattr(r, "bid", None)
-                if close is None:  # try ask
-                    close = getattr(r, "ask", None)
-                o = h = l = c = float(close)
-                yield Candle(r.time, o, h, l, c, getattr(r, "volume", 0.0))
+        """Yield one Candle per row, for callers that still consume bars one at a time."""
+        times = pd.DatetimeIndex(self.time)
+        cols = (a.tolist() for a in (self.open, self.high, self.low, self.close, self.volume))
+        return map(Candle, times, *cols)
@@ -1,3 +1,12 @@
-from .backtest_exec import BacktestExec  # noqa: F401
-# Avoid unconditional MT5 import:
-# from .mt5_exec import MT5Exec  # noqa: F401
+# Executors are resolved on first access (PEP 562) so importing the package
+# does not pull in pandas/numba or the MT5 terminal bindings.
+__all__ = ["BacktestExec", "MT5Exec"]
+
+def __getattr__(name):
+    if name == "BacktestExec":
+        from .backtest_exec import BacktestExec
+        return BacktestExec
+    if name == "MT5Exec":
+        from .mt5_exec import MT5Exec
+        return MT5Exec
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
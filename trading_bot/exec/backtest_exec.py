@@ -1,85 +1,141 @@
 """
 Simple backtesting executor.
 """
-from dataclasses import asdict
-from trading_bot.types import Trade, Stats
-from trading_bot.risk.risk_manager import compute_volume
-import csv
+import numpy as np
+import pandas as pd
+from trading_bot._njit import njit
+from trading_bot.data.candle_array import CandleArray
+from trading_bot.risk.risk_manager import _step_fraction, _volume
+from trading_bot.types import Candle, Stats, TRADE_DTYPE, trades_to_list
 
 VOL_MIN, VOL_STEP, VOL_MAX = 0.01, 0.01, 10.0  # conservative defaults
 
+@njit(cache=True)
+def _run_nb(o, h, l, side, sl, tp, equity0, risk, vol_min, vol_step, k_step, scale, vol_max,
+            contract_size):
+    """Bar loop over signal arrays. Opens at the signal bar's open, one trade at a time.
+
+    ``risk`` is ``risk_pct / 100`` and ``(k_step, scale)`` is ``_step_fraction(vol_step)``.
+
+    Returns (entry_idx, exit_idx, volume, exit_price, pnl, equity_curve, n_trades);
+    the trade arrays are valid up to ``n_trades``.
+    """
+    n = len(o)
+    # Entry and exit bars never coincide, so there are at most n//2 + 1 entries
+    m = n // 2 + 1
+    entry_idx = np.empty(m, np.int64)
+    exit_idx = np.empty(m, np.int64)
+    volume = np.empty(m)
+    exit_price = np.empty(m)
+    pnl = np.empty(m)
+    equity_curve = np.empty(n)
+    equity = equity0
+    k = 0
+    in_trade = False
+    t_side = 0
+    t_entry = t_sl = t_tp = t_vol = 0.0
+    for i in range(n):
+        if side[i] != 0 and not in_trade:
+            t_side = side[i]
+            t_entry = o[i]
+            t_sl = sl[i]
+            t_tp = tp[i]
+            t_vol = _volume(equity, t_entry, t_sl, risk, vol_min, vol_step, k_step, scale, vol_max)
+            entry_idx[k] = i
+            in_trade = True
+            equity_curve[i] = equity
+            continue
+
+        if in_trade:
+            if t_side > 0:
+                hit_sl = l[i] <= t_sl
+                hit_tp = h[i] >= t_tp
+            else:
+                hit_sl = h[i] >= t_sl
+                hit_tp = l[i] <= t_tp
+            if hit_sl or hit_tp:
+                px = t_sl if hit_sl else t_tp
+                pnl_t = (px - t_entry) * t_side * t_vol * contract_size
+                equity += pnl_t
+                exit_idx[k] = i
+                volume[k] = t_vol
+                exit_price[k] = px
+                pnl[k] = pnl_t
+                k += 1
+                in_trade = False
+        equity_curve[i] = equity
+    return entry_idx, exit_idx, volume, exit_price, pnl, equity_curve, k
+
 class BacktestExec:
     def __init__(self, cfg):
         self.cfg = cfg
+        self._contract_size = float(cfg.contract_size)
+        self.trades = np.empty(0, TRADE_DTYPE)  # trade log of the last run
 
     @staticmethod
-    def _pip(digits: int) -> float:
-        return 0.01 if digits in (1,2,3) else 0.0001
+    def _arrays(feed):
+        if hasattr(feed, "arrays"):
+            return feed.arrays()
+        store = CandleArray()
+        for bar in feed:
+            store.append(bar)
+        return store.arrays()
+
+    @staticmethod
+    def _signals(strat, time, o, h, l, c, vol):
+        if hasattr(strat, "signals"):
+            return strat.signals(h, l, c, digits=5)
+        # Generic strategies: one on_bar call per bar
+        n = len(c)
+        side = np.zeros(n, np.int8)
+        sl = np.zeros(n)
+        tp = np.zeros(n)
+        # Same Candle values as CsvFeed.iter(): Timestamp times and Python floats
+        bars = map(Candle, pd.DatetimeIndex(time), *(a.tolist() for a in (o, h, l, c, vol)))
+        for i, bar in enumerate(bars):
+            sig = strat.on_bar(bar, digits=5)
+            if sig:
+                side[i] = 1 if sig.side == "long" else -1
+                sl[i] = sig.sl_price
+                tp[i] = sig.tp_price
+        return side, sl, tp
 
     def run(self, feed, strat):
-        equity = 10000.0
-        trades = []
-        open_trade = None
-        pip = self._pip(5)
-        equity_curve = []
+        time, o, h, l, c, vol = self._arrays(feed)
+        side, sl, tp = self._signals(strat, time, o, h, l, c, vol)
+        k_step, scale = _step_fraction(VOL_STEP)
+        entry_idx, exit_idx, volume, exit_price, pnl_arr, equity, k = _run_nb(
+            o, h, l, side, sl, tp, 10000.0, float(self.cfg.risk_pct)/100.0, VOL_MIN, VOL_STEP,
+            k_step, scale, VOL_MAX, self._contract_size)
 
-        for bar in feed:
-            sig = strat.on_bar(bar, digits=5)
-            if sig and not open_trade:
-                entry = bar.open
-                vol = compute_volume(equity, entry, sig.sl_price,
-                                     self.cfg.risk_pct, VOL_MIN, VOL_STEP, VOL_MAX)
-                open_trade = Trade(
-                    entry_time=bar.time, exit_time=None, side=sig.side,
-                    entry_price=entry, exit_price=None, volume=vol,
-                    sl_price=sig.sl_price, tp_price=sig.tp_price
-                )
-                equity_curve.append((bar.time, equity))
-                continue
-
-            if open_trade:
-                hit_sl = (bar.low <= open_trade.sl_price) if open_trade.side == "long" else (bar.high >= open_trade.sl_price)
-                hit_tp = (bar.high >= open_trade.tp_price) if open_trade.side == "long" else (bar.low <= open_trade.tp_price)
-                if hit_sl or hit_tp:
-                    exit_price = open_trade.sl_price if hit_sl else open_trade.tp_price
-                    open_trade.exit_time = bar.time
-                    open_trade.exit_price = exit_price
-                    sign = 1 if open_trade.side == "long" else -1
-                    pnl_t = (open_trade.exit_price - open_trade.entry_price) * sign * open_trade.volume * 100000
-                    equity += pnl_t
-                    trades.append(open_trade)
-                    open_trade = None
-            equity_curve.append((bar.time, equity))
+        e, x = entry_idx[:k], exit_idx[:k]
+        trades = np.empty(k, TRADE_DTYPE)
+        trades["entry_time"] = time[e]
+        trades["exit_time"] = time[x]
+        trades["side_sign"] = side[e]
+        trades["entry_price"] = o[e]
+        trades["exit_price"] = exit_price[:k]
+        trades["volume"] = volume[:k]
+        trades["sl_price"] = sl[e]
+        trades["tp_price"] = tp[e]
+        self.trades = trades
 
         # Stats
-        pnl = 0.0
-        wins = 0
-        for t in trades:
-            sign = 1 if t.side == "long" else -1
-            pnl_t = (t.exit_price - t.entry_price) * sign * t.volume * 100000
-            pnl += pnl_t
-            if pnl_t > 0:
-                wins += 1
-        win_rate = (wins/len(trades)) if trades else 0.0
+        pnl_arr = pnl_arr[:k]
+        pnl = float(pnl_arr.sum())
+        win_rate = float((pnl_arr > 0).sum() / k) if k else 0.0
 
         # Max Drawdown
-        peak = -1e18
-        max_dd = 0.0
-        for _, eq in equity_curve:
-            if eq > peak:
-                peak = eq
-            dd = peak - eq
-            if dd > max_dd:
-                max_dd = dd
+        max_dd = float((np.maximum.accumulate(equity) - equity).max()) if len(equity) else 0.0
 
         # Expectancy
-        expectancy = (pnl/len(trades)) if trades else 0.0
+        expectancy = (pnl/k) if k else 0.0
 
         # Write equity.csv next to working dir
-        with open("equity.csv", "w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(["time","equity"])
-            for t, eq in equity_curve:
-                w.writerow([t, eq])
+        pd.DataFrame({"time": time, "equity": equity}).to_csv("equity.csv", index=False)
+
+        return Stats(k, win_rate, pnl, max_dd, expectancy)
 
-        return Stats(len(trades), win_rate, pnl, max_dd, expectancy)
+    def trade_list(self):
+        """Trades of the last run as Trade objects."""
+        return trades_to_list(self.trades)
@@ -6,10 +6,33 @@ import MetaTrader5 as mt5
 import pandas as pd
 from trading_bot.types import Candle
 
+RATES_BATCH = 64  # bars fetched per copy_rates_from_pos call
+_TF_UNIT_SECONDS = {"M": 60, "H": 3600, "D": 86400, "W": 604800, "MN": 2592000}
+
+def _tf_seconds(timeframe: str) -> int:
+    """Nominal bar length for an MT5 timeframe name such as ``M5`` or ``H1``."""
+    unit = timeframe.rstrip("0123456789")
+    return _TF_UNIT_SECONDS[unit] * int(timeframe[len(unit):] or 1)
+
 class MT5Exec:
     def __init__(self, cfg, dry_run=True):
         self.cfg = cfg
         self.dry = dry_run
+        self._last_bar_time = None  # open time (epoch s) of the last closed bar processed
+
+    def _wait_next_tick(self, last_msc: int, timeout: float, poll: float = 0.05):
+        """Return the first tick newer than ``last_msc``, or None after ``timeout`` seconds."""
+        # Bind the hot-loop lookups once; this polls every ``poll`` seconds
+        symbol, symbol_info_tick = self.cfg.symbol, mt5.symbol_info_tick
+        monotonic, sleep = time.monotonic, time.sleep
+        deadline = monotonic() + timeout
+        while True:
+            tick = symbol_info_tick(symbol)
+            if tick is not None and tick.time_msc != last_msc:
+                return tick
+            if monotonic() >= deadline:
+                return None
+            sleep(poll)
 
     def run_loop(self, strat):
         assert mt5.initialize(), "MT5 init failed"
@@ -17,18 +40,39 @@ class MT5Exec:
             assert mt5.symbol_select(self.cfg.symbol, True)
             info = mt5.symbol_info(self.cfg.symbol)
             digits = info.digits
+            tf = getattr(mt5, "TIMEFRAME_" + self.cfg.timeframe)
+            tf_sec = _tf_seconds(self.cfg.timeframe)
+            last_msc = 0
             while True:
-                rates = mt5.copy_rates_from_pos(self.cfg.symbol, getattr(mt5, self.cfg.timeframe), 0, 1)
-                if rates is None or len(rates) == 0:
-                    time.sleep(1); continue
-                r = rates[-1]
-                bar = Candle(pd.to_datetime(r['time'], unit='s'), r['open'], r['high'], r['low'], r['close'], r['tick_volume'])
-                sig = strat.on_bar(bar, digits)
+                # Only re-evaluate once the price has actually moved
+                tick = self._wait_next_tick(last_msc, timeout=1.0)
+                if tick is None:
+                    continue
+                last_msc = tick.time_msc
+                if self._last_bar_time is not None:
+                    # Nothing new can close before the bar after the last processed one ends
+                    remaining = self._last_bar_time + 2*tf_sec - tick.time
+                    if remaining > 0:
+                        time.sleep(min(remaining, 60))
+                        continue
+                rates = mt5.copy_rates_from_pos(self.cfg.symbol, tf, 0, RATES_BATCH)
+                if rates is None or len(rates) < 2:
+                    continue
+                closed = rates[:-1]  # the newest row is the bar still forming
+                if self._last_bar_time is not None:
+                    closed = closed[closed['time'] > self._last_bar_time]
+                if len(closed) == 0:
+                    continue
+                sig = None
+                for r in closed:
+                    bar = Candle(pd.to_datetime(r['time'], unit='s'), r['open'], r['high'], r['low'], r['close'], r['tick_volume'])
+                    sig = strat.on_bar(bar, digits)
+                self._last_bar_time = int(closed['time'][-1])
+                # Older bars in a batch only warm the strategy up; act on the newest one
                 if sig:
                     if self.dry:
                         print(f"signal: {sig}")
                     else:
                         print("TODO: send order")  # placeholder
-                time.sleep(1)
         finally:
             mt5.shutdown()
@@ -4,5 +4,12 @@ GUI package for the trading bot.
 This package contains the graphical user interface components for the trading bot.
 """
 
-# Import GUI components to make them available when importing the package
-from .main_window import MainWindow  # noqa: F401
+__all__ = ["MainWindow"]
+
+
+def __getattr__(name):
+    # Defer the PyQt5 import until a GUI component is actually requested
+    if name == "MainWindow":
+        from .main_window import MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
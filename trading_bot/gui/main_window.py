@@ -4,7 +4,9 @@ Main window for the trading bot GUI.
 This module defines the main application window with tabs for different
 functionality (trading, backtesting, settings, etc.).
 """
+import dataclasses
 import logging
+from types import SimpleNamespace
 from typing import Dict, Any, Optional, Type, Union
 
 from PyQt5.QtWidgets import (
@@ -25,50 +27,64 @@ from PyQt5.QtWidgets import (
     QLineEdit,
     QTextEdit,
     QFileDialog,
+    QProgressBar,
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject, QThread
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QObject, QThread, QRunnable, QThreadPool
 
 from ..interfaces import IStrategy, IBroker, IRiskManager
-from trading_bot.broker_factory import BrokerFactory
 from ..config import BotConfig
-from ..app import TradingBot, setup_container
 
 logger = logging.getLogger(__name__)
 
+# Containers built by setup_container, reused across start/stop cycles
+_container_cache: Dict[tuple, Any] = {}
+
+# How long closing the window waits for running workers to exit
+_SHUTDOWN_TIMEOUT_MS = 5000
+
 
 class WorkerSignals(QObject):
     """Defines the signals available from a running worker thread."""
     error = pyqtSignal(str)
     result = pyqtSignal(object)
+    started = pyqtSignal()
     finished = pyqtSignal()
 
 
-class TradingWorker(QObject):
-    """Worker thread for running the trading bot."""
+class TradingWorker(QRunnable):
+    """Pool task for running the trading bot."""
     
     def __init__(self, config: BotConfig, broker_type: str = 'mt5'):
         super().__init__()
+        # The tab keeps a reference and reads _is_running after run() returns
+        self.setAutoDelete(False)
         self.config = config
         self.broker_type = broker_type
         self.bot = None
         self.signals = WorkerSignals()
         self._is_running = False
+        self._stop_requested = False
     
+    @pyqtSlot()
     def run(self):
         """Run the trading bot in a separate thread."""
         try:
+            # Deferred so the window can open without loading the broker stack
+            from ..app import TradingBot, setup_container
             self._is_running = True
-            # Create a lightweight args namespace to configure the container
-            class Args:
-                symbol = self.config.symbol
-                broker = self.broker_type
-                debug = self.config.enable_debug
-
-            # Build container using the same setup function as CLI
-            container = setup_container(Args())
+            self.signals.started.emit()
+            key = (self.config.symbol, self.broker_type, self.config.enable_debug)
+            container = _container_cache.get(key)
+            if container is None:
+                # Build container using the same setup function as CLI
+                args = SimpleNamespace(symbol=key[0], broker=key[1], debug=key[2])
+                container = _container_cache[key] = setup_container(args)
             self.bot = TradingBot(container)
             if self.bot.initialize():
                 self.bot.running = True
+                # stop() may have run before self.bot was set
+                if self._stop_requested:
+                    self.bot.running = False
                 self.bot.run()
             self.signals.finished.emit()
         except Exception as e:
@@ -79,10 +95,34 @@ class TradingWorker(QObject):
     
     def stop(self):
         """Stop the trading bot."""
+        self._stop_requested = True
         if self.bot is not None:
             self.bot.running = False
 
 
+class BacktestWorker(QObject):
+    """Worker thread for running a backtest off the GUI thread."""
+    
+    def __init__(self, file_name: str, config: BotConfig):
+        super().__init__()
+        self.file_name = file_name
+        self.config = config
+        self.signals = WorkerSignals()
+    
+    @pyqtSlot()
+    def run(self):
+        """Run the backtest and emit the resulting trades."""
+        try:
+            from trading_bot.backtester import run_backtest
+            trades = run_backtest(self.file_name, self.config)
+            self.signals.result.emit(trades)
+        except Exception as e:
+            logger.exception("Error in backtest worker")
+            self.signals.error.emit(str(e))
+        finally:
+            self.signals.finished.emit()
+
+
 class StrategyConfigWidget(QWidget):
     """Widget for configuring strategy parameters."""
     
@@ -106,21 +146,16 @@ class StrategyConfigWidget(QWidget):
         
         form_layout.addRow("Strategy:", self.strategy_combo)
         
-        # Strategy parameters
-        self.param_widgets = {}
-        
         # Distance/Time parameters
         self.distance_spin = QDoubleSpinBox()
         self.distance_spin.setRange(0.1, 1000.0)
         self.distance_spin.setValue(self.config.distance_pips)
         self.distance_spin.setSuffix(" pips")
-        self.param_widgets['distance_pips'] = self.distance_spin
         
         self.time_spin = QSpinBox()
         self.time_spin.setRange(1, 3600)
         self.time_spin.setValue(self.config.time_seconds)
         self.time_spin.setSuffix(" seconds")
-        self.param_widgets['time_seconds'] = self.time_spin
         
         # Add parameter widgets to form
         form_layout.addRow("Distance:", self.distance_spin)
@@ -141,42 +176,35 @@ class StrategyConfigWidget(QWidget):
         self.lot_size_spin.setRange(0.01, 100.0)
         self.lot_size_spin.setValue(self.config.lot_size)
         self.lot_size_spin.setSingleStep(0.01)
-        self.param_widgets['lot_size'] = self.lot_size_spin
         
         # Money management
         self.mm_spin = QDoubleSpinBox()
         self.mm_spin.setRange(0.0, 10.0)
         self.mm_spin.setValue(self.config.mm)
         self.mm_spin.setSingleStep(0.1)
-        self.param_widgets['mm'] = self.mm_spin
         
         # Max lot size
         self.mm_max_lot_spin = QDoubleSpinBox()
         self.mm_max_lot_spin.setRange(0.01, 100.0)
-        # Use max_lot_size from configuration instead of the non‑existent mm_max_lot
-        self.mm_max_lot_spin.setValue(getattr(self.config, 'max_lot_size', self.config.max_lot_size))
+        self.mm_max_lot_spin.setValue(self.config.max_lot_size)
         self.mm_max_lot_spin.setSingleStep(0.1)
-        self.param_widgets['max_lot_size'] = self.mm_max_lot_spin
         
         # Stop loss and take profit
         self.sl_spin = QDoubleSpinBox()
         self.sl_spin.setRange(0, 1000)
         self.sl_spin.setValue(self.config.stop_loss_pips)
         self.sl_spin.setSuffix(" pips")
-        self.param_widgets['stop_loss_pips'] = self.sl_spin
         
         self.tp_spin = QDoubleSpinBox()
         self.tp_spin.setRange(0, 1000)
         self.tp_spin.setValue(self.config.take_profit_pips)
         self.tp_spin.setSuffix(" pips")
-        self.param_widgets['take_profit_pips'] = self.tp_spin
         
         # Trailing stop
         self.ts_spin = QDoubleSpinBox()
         self.ts_spin.setRange(0, 1000)
         self.ts_spin.setValue(self.config.trailing_stop)
         self.ts_spin.setSuffix(" pips")
-        self.param_widgets['trailing_stop'] = self.ts_spin
         
         # Add widgets to risk layout
         risk_layout.addRow("Fixed lot size:", self.lot_size_spin)
@@ -210,12 +238,25 @@ class StrategyConfigWidget(QWidget):
         # Debug mode
         self.debug_check = QCheckBox("Enable debug mode")
         self.debug_check.setChecked(self.config.enable_debug)
-        self.param_widgets['enable_debug'] = self.debug_check
         layout.addWidget(self.debug_check)
         
         # Stretch to push everything to the top
         layout.addStretch()
         
+        # (config field, widget, getter) read back by get_config
+        self._field_binding = [
+            ('symbol', self.symbol_combo, 'currentText'),
+            ('distance_pips', self.distance_spin, 'value'),
+            ('time_seconds', self.time_spin, 'value'),
+            ('lot_size', self.lot_size_spin, 'value'),
+            ('mm', self.mm_spin, 'value'),
+            ('max_lot_size', self.mm_max_lot_spin, 'value'),
+            ('stop_loss_pips', self.sl_spin, 'value'),
+            ('take_profit_pips', self.tp_spin, 'value'),
+            ('trailing_stop', self.ts_spin, 'value'),
+            ('enable_debug', self.debug_check, 'isChecked'),
+        ]
+        
         self.setLayout(layout)
     
     def on_strategy_changed(self, index: int):
@@ -227,20 +268,11 @@ class StrategyConfigWidget(QWidget):
     
     def get_config(self) -> BotConfig:
         """Get the current configuration from the UI."""
-        # Create a new config with updated values
-        config = BotConfig(
-            symbol=self.symbol_combo.currentText(),
-            distance_pips=self.distance_spin.value(),
-            time_seconds=self.time_spin.value(),
-            lot_size=self.lot_size_spin.value(),
-            mm=self.mm_spin.value(),
-            max_lot_size=self.mm_max_lot_spin.value(),
-            stop_loss_pips=self.sl_spin.value(),
-            take_profit_pips=self.tp_spin.value(),
-            trailing_stop=self.ts_spin.value(),
-            enable_debug=self.debug_check.isChecked(),
+        # Copy the current config, overriding only the fields edited here
+        return dataclasses.replace(
+            self.config,
+            **{name: getattr(widget, getter)() for name, widget, getter in self._field_binding}
         )
-        return config
 
 
 class TradingTab(QWidget):
@@ -250,7 +282,7 @@ class TradingTab(QWidget):
         super().__init__(parent)
         self.config = config
         self.worker = None
-        self.worker_thread = None
+        self.pool = QThreadPool.globalInstance()
         self.init_ui()
     
     def init_ui(self):
@@ -291,25 +323,16 @@ class TradingTab(QWidget):
         self.start_button.setText("Stop Trading")
         self.status_label.setText("Status: Starting...")
         
-        # Create worker and thread
+        # Create worker
         self.worker = TradingWorker(self.config)
-        self.worker_thread = QThread()
-        
-        # Move worker to thread
-        self.worker.moveToThread(self.worker_thread)
         
         # Connect signals
-        self.worker_thread.started.connect(self.worker.run)
-        self.worker.signals.finished.connect(self.worker_thread.quit)
-        self.worker.signals.finished.connect(self.worker.deleteLater)
-        self.worker_thread.finished.connect(self.worker_thread.deleteLater)
         self.worker.signals.error.connect(self.on_error)
+        self.worker.signals.started.connect(self.update_status)
+        self.worker.signals.finished.connect(self.on_finished)
         
-        # Start the thread
-        self.worker_thread.start()
-        
-        # Update status after a short delay to allow thread to start
-        QTimer.singleShot(500, self.update_status)
+        # Run on a pooled thread
+        self.pool.start(self.worker)
     
     def stop_trading(self):
         """Stop the trading bot."""
@@ -318,6 +341,13 @@ class TradingTab(QWidget):
             self.status_label.setText("Status: Stopping...")
             self.start_button.setEnabled(False)
     
+    def shutdown(self, timeout_ms: int) -> bool:
+        """Stop the bot and wait for the pool to drain; False if it is still running."""
+        if self.worker is not None:
+            self.worker.stop()
+        return self.pool.waitForDone(timeout_ms)
+    
+    @pyqtSlot()
     def update_status(self):
         """Update the status label based on worker state."""
         if self.worker is not None and self.worker._is_running:
@@ -328,6 +358,14 @@ class TradingTab(QWidget):
             self.start_button.setText("Start Trading")
             self.start_button.setEnabled(True)
     
+    @pyqtSlot()
+    def on_finished(self):
+        """Handle the trading bot exiting normally."""
+        self.status_label.setText("Status: Stopped")
+        self.start_button.setText("Start Trading")
+        self.start_button.setEnabled(True)
+    
+    @pyqtSlot(str)
     def on_error(self, message: str):
         """Handle errors from the worker thread."""
         QMessageBox.critical(self, "Error", f"An error occurred: {message}")
@@ -342,6 +380,8 @@ class BacktestTab(QWidget):
     def __init__(self, config: BotConfig, parent=None):
         super().__init__(parent)
         self.config = config
+        self.worker = None
+        self.worker_thread = None
         self.init_ui()
     
     def init_ui(self):
@@ -365,12 +405,18 @@ class BacktestTab(QWidget):
         controls_layout.addWidget(self.browse_button)
         controls_layout.addWidget(self.run_button)
         
+        # Progress bar, shown while a backtest runs
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)  # busy indicator; the backtester reports no progress
+        self.progress_bar.hide()
+        
         # Results area
         self.results_text = QTextEdit()
         self.results_text.setReadOnly(True)
         
         # Add widgets to layout
         layout.addLayout(controls_layout)
+        layout.addWidget(self.progress_bar)
         layout.addWidget(self.results_text)
         
         self.setLayout(layout)
@@ -384,34 +430,70 @@ class BacktestTab(QWidget):
             self.file_edit.setText(file_name)
     
     def run_backtest(self):
-        """Run a backtest with the selected file."""
+        """Run a backtest with the selected file in a worker thread."""
         file_name = self.file_edit.text()
         if not file_name:
             QMessageBox.warning(self, "Warning", "Please select a CSV file")
             return
-        try:
-            # Run the backtest and display results
-            from trading_bot.backtester import run_backtest
-            self.results_text.clear()
-            self.results_text.append(f"Running backtest on {file_name}...")
-            trades = run_backtest(file_name, self.config)
-            self.results_text.append(f"Backtest complete!\n")
-            self.results_text.append(f"Trades: {len(trades)}")
-            # Optionally list trades
-            for i, trade in enumerate(trades, start=1):
-                self.results_text.append(
-                    f"{i}. {trade.direction.upper()} @ {trade.entry_price} lot={trade.lot} SL={trade.sl} TP={trade.tp}"
-                )
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Backtest failed: {str(e)}")
+        if self.worker_thread is not None:
+            return
+        
+        self.results_text.clear()
+        self.run_button.setEnabled(False)
+        self.progress_bar.show()
+        
+        # Create worker and thread
+        self.worker = BacktestWorker(file_name, self.config)
+        self.worker_thread = QThread()
+        self.worker.moveToThread(self.worker_thread)
+        
+        # Connect signals
+        self.worker_thread.started.connect(self.worker.run)
+        self.worker.signals.result.connect(self.finish_backtest)
+        self.worker.signals.error.connect(self.on_error)
+        self.worker.signals.finished.connect(self.worker_thread.quit)
+        self.worker.signals.finished.connect(self.worker.deleteLater)
+        self.worker_thread.finished.connect(self.worker_thread.deleteLater)
+        self.worker_thread.finished.connect(self.on_thread_finished)
+        
+        self.worker_thread.start()
+    
+    def shutdown(self, timeout_ms: int) -> bool:
+        """Wait for a running backtest to finish; False if it is still running."""
+        if self.worker_thread is None:
+            return True
+        self.worker_thread.quit()
+        return self.worker_thread.wait(timeout_ms)
     
-    def finish_backtest(self):
+    @pyqtSlot(object)
+    def finish_backtest(self, trades: list):
         """Called when backtest is complete."""
-        self.results_text.append("Backtest complete!")
-        self.results_text.append("Results:")
-        self.results_text.append("  - Trades: 10")
-        self.results_text.append("  - Win rate: 60%")
-        self.results_text.append("  - Profit factor: 1.5")
+        self.results_text.append(f"Backtest complete!\n")
+        self.results_text.append(f"Trades: {len(trades)}")
+        # Optionally list trades; one append keeps it to a single relayout
+        lines = [
+            f"{i}. {trade.direction.upper()} @ {trade.entry_price} lot={trade.lot} SL={trade.sl} TP={trade.tp}"
+            for i, trade in enumerate(trades, start=1)
+        ]
+        if lines:
+            self.results_text.setUpdatesEnabled(False)
+            try:
+                self.results_text.append("\n".join(lines))
+            finally:
+                self.results_text.setUpdatesEnabled(True)
+    
+    @pyqtSlot(str)
+    def on_error(self, message: str):
+        """Handle errors from the worker thread."""
+        QMessageBox.critical(self, "Error", f"Backtest failed: {message}")
+    
+    @pyqtSlot()
+    def on_thread_finished(self):
+        """Release the finished worker and re-enable the run button."""
+        self.worker = None
+        self.worker_thread = None
+        self.progress_bar.hide()
+        self.run_button.setEnabled(True)
 
 
 class MainWindow(QMainWindow):
@@ -453,12 +535,12 @@ class MainWindow(QMainWindow):
         tab_widget = QTabWidget()
         
         # Trading tab
-        trading_tab = TradingTab(self.config)
-        tab_widget.addTab(trading_tab, "Trading")
+        self.trading_tab = TradingTab(self.config)
+        tab_widget.addTab(self.trading_tab, "Trading")
         
         # Backtest tab
-        backtest_tab = BacktestTab(self.config)
-        tab_widget.addTab(backtest_tab, "Backtest")
+        self.backtest_tab = BacktestTab(self.config)
+        tab_widget.addTab(self.backtest_tab, "Backtest")
         
         # Add widgets to main layout
         main_layout.addWidget(config_panel)
@@ -475,6 +557,10 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage("Settings saved", 3000)  # Show for 3 seconds
     
     def closeEvent(self, event):
-        """Handle window close event."""
-        # TODO: Clean up any running threads or connections
+        """Stop running workers before the window closes."""
+        # The application joins the global thread pool on exit, so a bot left
+        # looping there would keep the process alive after the window is gone
+        for tab in (self.trading_tab, self.backtest_tab):
+            if not tab.shutdown(_SHUTDOWN_TIMEOUT_MS):
+                logger.warning("%s worker still running on close", type(tab).__name__)
         event.accept()
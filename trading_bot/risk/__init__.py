@@ -1 +1,2 @@
-from .risk_manager import step_round, compute_volume  # noqa: F401
\ No newline at end of file
+from .risk_manager import (  # noqa: F401
+    step_round, compute_volume, compute_volume_batch, compute_volume_fast)
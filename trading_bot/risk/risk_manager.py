@@ -1,18 +1,77 @@
 """
 Risk manager functions.
 """
-from decimal import Decimal, ROUND_DOWN
+import math
+import numpy as np
+from trading_bot._njit import njit
+
+@njit(cache=True)
+def _step_fraction(step):
+    """Write a decimal step as k / scale with integral k and a power-of-ten scale (0.01 -> 1, 100)."""
+    scale = 1.0
+    while scale < 1e9 and abs(step*scale - round(step*scale)) > 1e-6:
+        scale *= 10.0
+    return float(round(step*scale)), scale
+
+@njit(cache=True)
+def _trunc_step(x, step, k, scale):
+    # Truncates toward zero: floor the magnitude, then restore the sign.
+    # The epsilon keeps exact multiples (e.g. 0.3 / 0.1 == 2.9999999999999996) from
+    # losing a step. n*k is an exact integer, so dividing by scale gives the double
+    # closest to the decimal multiple: 0.57 rather than 57 * 0.01 == 0.5700000000000001.
+    # np.floor stays in float; numba's math.floor returns int64, which wraps for huge x/step
+    return math.copysign(np.floor(abs(x) / step + 1e-9) * k / scale, x)
 
 def step_round(x: float, step: float) -> float:
-    q = Decimal(str(step))
-    return float((Decimal(x) / q).to_integral_value(rounding=ROUND_DOWN) * q)
+    """Truncate ``x`` toward zero to a multiple of ``step``.
 
-def compute_volume(equity: float, entry: float, sl: float,
-                   risk_pct: float, vol_min: float, vol_step: float, vol_max: float) -> float:
-    risk_amt = equity * (risk_pct/100.0)
+    >>> step_round(0.579, 0.01), step_round(-0.35, 0.1)
+    (0.57, -0.3)
+    """
+    k, scale = _step_fraction(step)
+    return float(_trunc_step(x, step, k, scale))
+
+@njit(cache=True)
+def _volume(equity, entry, sl, risk, vol_min, vol_step, k, scale, vol_max):
+    # risk is a fraction and (k, scale) = _step_fraction(vol_step), so loops derive them once
     stop = abs(entry - sl)
-    if stop == 0:
+    if stop == 0.0:
         return vol_min
-    raw = risk_amt / stop
-    adj = max(vol_min, min(vol_max, step_round(raw, vol_step)))
-    return adj
+    raw = equity * risk / stop
+    return max(vol_min, min(vol_max, _trunc_step(raw, vol_step, k, scale)))
+
+@njit(cache=True)
+def compute_volume_fast(equity, entry, sl, risk_pct, vol_min, vol_step, vol_max):
+    """Compiled float-only compute_volume for use inside other jitted loops."""
+    k, scale = _step_fraction(vol_step)
+    return _volume(equity, entry, sl, risk_pct/100.0, vol_min, vol_step, k, scale, vol_max)
+
+def compute_volume(equity: float, entry: float, sl: float,
+                   risk_pct: float, vol_min: float, vol_step: float, vol_max: float) -> float:
+    """Lot size risking ``risk_pct`` percent of ``equity`` between ``entry`` and ``sl``.
+
+    A stop too tight to size sensibly is capped at ``vol_max``:
+
+    >>> compute_volume(1e6, 1.1, 1.1 + 1e-13, 1.0, 0.01, 0.01, 10.0)
+    10.0
+    """
+    # Floats keep the compiled kernel to a single specialization
+    return compute_volume_fast(float(equity), float(entry), float(sl), float(risk_pct),
+                               float(vol_min), float(vol_step), float(vol_max))
+
+@njit(cache=True)
+def _volume_loop(equity, entry, sl, risk, vol_min, vol_step, k, scale, vol_max, out):
+    for i in range(out.size):
+        out[i] = _volume(equity[i], entry[i], sl[i], risk, vol_min, vol_step, k, scale, vol_max)
+
+def compute_volume_batch(equity, entry, sl,
+                         risk_pct: float, vol_min: float, vol_step: float, vol_max: float) -> np.ndarray:
+    """Vectorized compute_volume; array arguments broadcast against each other."""
+    # np.array copies the broadcast views into contiguous buffers, keeping 0-d shapes
+    equity, entry, sl = (np.array(a, dtype=np.float64) for a in np.broadcast_arrays(equity, entry, sl))
+    out = np.empty(equity.shape)
+    vol_step = float(vol_step)
+    k, scale = _step_fraction(vol_step)
+    _volume_loop(equity.ravel(), entry.ravel(), sl.ravel(), float(risk_pct)/100.0,
+                 float(vol_min), vol_step, k, scale, float(vol_max), out.reshape(-1))
+    return out
@@ -2,34 +2,150 @@
 Distance/Time breakout strategy.
 """
 import collections
+import numpy as np
+from trading_bot._njit import njit, NUMBA_AVAILABLE
 from trading_bot.types import Signal, Candle
 
+# Pip size indexed by symbol digits: 0.01 for 1-3 digit quotes (JPY pairs, metals)
+_PIP_BY_DIGITS = (0.0001,) + (0.01,)*3 + (0.0001,)*12
+
+def _breakout(hi, lo, last, dist, sl_abs, tp_abs, pip):
+    """Breakout decision for one window: (side, sl, tp) with side +1 long, -1 short, 0 none.
+
+    ``sl_abs``/``tp_abs`` are the SL and TP distances in price units.
+    """
+    if (hi - lo) / pip < dist:
+        return 0, 0.0, 0.0
+    if last >= hi:
+        return 1, last - sl_abs, last + tp_abs
+    if last <= lo:
+        return -1, last + sl_abs, last - tp_abs
+    return 0, 0.0, 0.0
+
+# Compiled copy for the batch scan. on_bar calls _breakout directly: for a single
+# window the jit dispatch costs more than the arithmetic it saves.
+_signal_kernel = njit(cache=True)(_breakout)
+
+@njit(cache=True)
+def _signals_nb(high, low, close, win, dist, sl_abs, tp_abs, pip):
+    """Batch equivalent of calling ``on_bar`` on every bar of a fresh strategy.
+
+    Returns per-bar side (+1 long, -1 short, 0 none), SL and TP arrays.
+    """
+    n = len(close)
+    side = np.zeros(n, np.int8)
+    sl = np.zeros(n)
+    tp = np.zeros(n)
+    # Indices of the current window high/low; rescan only once that bar leaves
+    # the window, which is rare compared with an ordinary bar ageing out
+    hi_i = lo_i = -1
+    for i in range(n):
+        start = max(0, i - win + 1)
+        if hi_i < start:
+            hi_i = start
+            for j in range(start + 1, i + 1):
+                if high[j] >= high[hi_i]:
+                    hi_i = j
+        elif high[i] >= high[hi_i]:
+            hi_i = i
+        if lo_i < start:
+            lo_i = start
+            for j in range(start + 1, i + 1):
+                if low[j] <= low[lo_i]:
+                    lo_i = j
+        elif low[i] <= low[lo_i]:
+            lo_i = i
+        if i >= win - 1:
+            side[i], sl[i], tp[i] = _signal_kernel(high[hi_i], low[lo_i], close[i],
+                                                   dist, sl_abs, tp_abs, pip)
+    return side, sl, tp
+
+def _signals_np(high, low, close, win, dist, sl_abs, tp_abs, pip):
+    """NumPy version of _signals_nb, used when numba is unavailable."""
+    n = len(close)
+    side = np.zeros(n, np.int8)
+    sl = np.zeros(n)
+    tp = np.zeros(n)
+    if n < win:
+        return side, sl, tp
+    # (n - win + 1, win) strided views; row j is the window ending at bar j + win - 1
+    view = np.lib.stride_tricks.sliding_window_view
+    hi = view(high, win).max(axis=1)
+    lo = view(low, win).min(axis=1)
+    last = close[win - 1:]
+    wide = ~((hi - lo) / pip < dist)
+    is_long = wide & (last >= hi)
+    is_short = wide & ~is_long & (last <= lo)
+    # Views into the outputs, aligned with the windows
+    side_w, sl_w, tp_w = side[win - 1:], sl[win - 1:], tp[win - 1:]
+    side_w[is_long] = 1
+    side_w[is_short] = -1
+    sl_w[is_long] = last[is_long] - sl_abs
+    tp_w[is_long] = last[is_long] + tp_abs
+    sl_w[is_short] = last[is_short] + sl_abs
+    tp_w[is_short] = last[is_short] - tp_abs
+    return side, sl, tp
+
 class DistanceTime:
-    def __init__(self, cfg) -> None:
+    def __init__(self, cfg, digits: int = 5) -> None:
         s = cfg.strategy
         self.win = s["window_minutes"]
         self.dist = s["distance_pips"]
         self.sl_pips = s["sl_pips"]
         self.tp_rr = s["tp_rr"]
-        self.window = collections.deque(maxlen=max(1, self.win))
+        self._size = max(1, self.win)
+        # Monotonic (bar index, price) deques: the front is the window high/low
+        self._max_dq = collections.deque()
+        self._min_dq = collections.deque()
+        self._t = -1  # index of the latest bar
+        self._set_digits(digits)
 
     @staticmethod
     def _pip(digits: int) -> float:
-        return 0.01 if digits in (1,2,3) else 0.0001
+        return _PIP_BY_DIGITS[digits]
+
+    def _set_digits(self, digits: int) -> None:
+        # Pip size and SL/TP distances only change with the symbol's digits, so
+        # an unusable value is rejected here rather than checked per bar
+        if not 0 <= digits < len(_PIP_BY_DIGITS):
+            raise ValueError(f"unsupported symbol digits: {digits}")
+        self.digits = digits
+        self._pip_cached = pip = self._pip(digits)
+        self._sl_abs = self.sl_pips*pip
+        self._tp_abs = self.sl_pips*self.tp_rr*pip
 
     def on_bar(self, bar: Candle, digits: int = 5):
-        self.window.append(bar)
-        if len(self.window) < self.window.maxlen:
+        if digits != self.digits:
+            self._set_digits(digits)
+        self._t = t = self._t + 1
+        # Locals: the while conditions below re-read these on every pop
+        high, low = bar.high, bar.low
+        max_dq, min_dq = self._max_dq, self._min_dq
+        while max_dq and max_dq[-1][1] <= high:
+            max_dq.pop()
+        max_dq.append((t, high))
+        while min_dq and min_dq[-1][1] >= low:
+            min_dq.pop()
+        min_dq.append((t, low))
+        # Drop bars that have left the window
+        oldest = t - self._size
+        if max_dq[0][0] <= oldest:
+            max_dq.popleft()
+        if min_dq[0][0] <= oldest:
+            min_dq.popleft()
+        if t + 1 < self._size:
             return None
-        hi = max(c.high for c in self.window)
-        lo = min(c.low for c in self.window)
-        dist_pips = (hi - lo) / self._pip(digits)
-        if dist_pips < self.dist:
+        side, sl, tp = _breakout(max_dq[0][1], min_dq[0][1], bar.close, self.dist,
+                                 self._sl_abs, self._tp_abs, self._pip_cached)
+        if side == 0:
             return None
-        last = self.window[-1].close
-        pip = self._pip(digits)
-        if last >= hi:
-            return Signal("long", last - self.sl_pips*pip, last + self.sl_pips*self.tp_rr*pip)
-        if last <= lo:
-            return Signal("short", last + self.sl_pips*pip, last - self.sl_pips*self.tp_rr*pip)
-        return None
+        return Signal("long" if side > 0 else "short", sl, tp)
+
+    def signals(self, high, low, close, digits: int = 5):
+        """Evaluate the whole series at once; ignores any state built by ``on_bar``."""
+        if digits != self.digits:
+            self._set_digits(digits)
+        # Without numba the NumPy sliding-window version beats the interpreted loop
+        kernel = _signals_nb if NUMBA_AVAILABLE else _signals_np
+        return kernel(high, low, close, self._size, float(self.dist),
+                      float(self._sl_abs), float(self._tp_abs), self._pip_cached)
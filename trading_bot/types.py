@@ -1,12 +1,18 @@
 """
 Type definitions for core trading entities.
 """
+import json
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, NamedTuple, Optional
+import numpy as np
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
-@dataclass
-class Candle:
+# Immutable per-bar/per-run records are NamedTuples: no __dict__, cheap to build
+class Candle(NamedTuple):
     time: datetime
     open: float
     high: float
@@ -14,27 +20,48 @@ class Candle:
     close: float
     volume: float
 
-@dataclass
-class Signal:
+class Signal(NamedTuple):
     side: str
     sl_price: float
     tp_price: float
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     entry_time: datetime
     exit_time: Optional[datetime]
     side: str
+    side_sign: int  # +1 long, -1 short
     entry_price: float
     exit_price: Optional[float]
     volume: float
     sl_price: float
     tp_price: float
 
-@dataclass
-class Stats:
+# Columnar trade log used by the backtester; one record per closed trade
+TRADE_DTYPE = np.dtype([
+    ("entry_time", "datetime64[ns]"), ("exit_time", "datetime64[ns]"), ("side_sign", "i1"),
+    ("entry_price", "f8"), ("exit_price", "f8"), ("volume", "f8"),
+    ("sl_price", "f8"), ("tp_price", "f8"),
+])
+
+def trades_to_list(trades: np.ndarray) -> List[Trade]:
+    """Materialize Trade objects from a TRADE_DTYPE array."""
+    cols = [trades[k].tolist() for k in ("side_sign", "entry_price", "exit_price", "volume", "sl_price", "tp_price")]
+    entry_times = trades["entry_time"].astype("datetime64[us]").tolist()
+    exit_times = trades["exit_time"].astype("datetime64[us]").tolist()
+    return [
+        Trade(et, xt, "long" if sd > 0 else "short", sd, ep, xp, vol, slp, tpp)
+        for et, xt, sd, ep, xp, vol, slp, tpp in zip(entry_times, exit_times, *cols)
+    ]
+
+class Stats(NamedTuple):
     n_trades: int
     win_rate: float
     pnl: float
     max_dd: float
     expectancy: float
+
+    def to_json(self) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(self._asdict(), option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(self._asdict()).encode()